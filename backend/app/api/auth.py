@@ -9,17 +9,27 @@ from fastapi import APIRouter, HTTPException, Depends
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel, EmailStr
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
-from jose import jwt
-from passlib.context import CryptContext
+from datetime import timedelta
+import hashlib
+import time
+import jwt
+from cachetools import TTLCache
 
 from app.core.config import settings
+from app.core.security import get_password_hash, run_password_task, verify_password
 
 router = APIRouter()
 security = HTTPBearer()
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# JWT settings as module globals. The signing key is encoded to bytes
+# once so encode/decode skip the str-to-bytes conversion on every call.
+_SIGNING_KEY = settings.SECRET_KEY.encode()
+_ALGORITHM = settings.ALGORITHM
+_ALGORITHMS = [_ALGORITHM]
+_EXP_MIN = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+
+# Short-lived cache of validated token payloads, keyed by token digest
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
 
 
 class UserLogin(BaseModel):
@@ -43,7 +53,18 @@ class Token(BaseModel):
     expires_in: int
 
 
-def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
+class UserInfo(BaseModel):
+    """Current user response model."""
+    user_id: Optional[str] = None
+    email: Optional[str] = None
+    role: Optional[str] = None
+    full_name: Optional[str] = None
+    exp: Optional[int] = None
+
+
+def create_access_token(
+    *, expires_delta: Optional[timedelta] = None, **claims: Any
+) -> str:
     """
     Create JWT access token.
     
@@ -51,54 +72,81 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     Used for authenticating API requests.
     
     Args:
-        data: User data to encode in token
         expires_delta: Custom expiration time (optional)
+        **claims: User claims to encode in token
         
     Returns:
         Encoded JWT token string
     """
-    to_encode = data.copy()
-    
+    # Expiry as integer epoch seconds, the form the exp claim is stored in
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = int(time.time()) + _EXP_MIN * 60
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    claims["exp"] = expire
+    encoded_jwt = jwt.encode(claims, _SIGNING_KEY, algorithm=_ALGORITHM)
     
     return encoded_jwt
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def decode_access_token(token_str: str) -> Dict[str, Any]:
     """
-    Verify password against hash.
+    Decode and validate JWT access token.
     
-    Uses bcrypt to verify plain text password against stored hash.
+    Validated payloads are cached for a few seconds so repeated
+    requests with the same token skip signature verification.
+    Cached entries are still checked against their expiry claim.
     
     Args:
-        plain_password: The plain text password
-        hashed_password: The stored password hash
+        token_str: Encoded JWT token string
         
     Returns:
-        True if password matches, False otherwise
-    """
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password: str) -> str:
+        Decoded token payload
+        
+    Raises:
+        jwt.ExpiredSignatureError: If token has expired
+        jwt.InvalidTokenError: If token is invalid
     """
-    Hash password using bcrypt.
+    key = hashlib.blake2b(token_str.encode(), digest_size=16).digest()
     
-    Creates secure password hash for storage.
+    payload = _token_cache.get(key)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return payload
+        _token_cache.pop(key, None)
+        raise jwt.ExpiredSignatureError("Signature has expired.")
     
-    Args:
-        password: Plain text password
-        
-    Returns:
-        Bcrypt password hash
-    """
-    return pwd_context.hash(password)
+    payload = jwt.decode(token_str, _SIGNING_KEY, algorithms=_ALGORITHMS)
+    _token_cache[key] = payload
+    
+    return payload
+
+
+# Demo users - replace with actual user database lookup.
+# Hashes are computed once at import rather than on every login request.
+_ADMIN_HASH = get_password_hash("admin123")
+_LAWYER_HASH = get_password_hash("lawyer123")
+
+# Verified against for unknown emails so every login costs exactly one
+# hash check, avoiding a timing side channel on account existence
+_DUMMY_HASH = get_password_hash("dummy")
+
+demo_users: Dict[str, Dict[str, str]] = {
+    "admin@legaltech.com": {
+        "password_hash": _ADMIN_HASH,
+        "user_id": "1",
+        "role": "admin",
+        "full_name": "Admin User"
+    },
+    "lawyer@legaltech.com": {
+        "password_hash": _LAWYER_HASH,
+        "user_id": "2",
+        "role": "lawyer",
+        "full_name": "Legal Practitioner"
+    }
+}
 
 
 @router.post("/login", response_model=Token)
@@ -118,46 +166,31 @@ async def login(user_data: UserLogin) -> Token:
     Raises:
         HTTPException: If credentials are invalid
     """
-    # Demo authentication logic - replace with actual user database lookup
-    demo_users = {
-        "admin@legaltech.com": {
-            "password_hash": get_password_hash("admin123"),
-            "user_id": "1",
-            "role": "admin",
-            "full_name": "Admin User"
-        },
-        "lawyer@legaltech.com": {
-            "password_hash": get_password_hash("lawyer123"),
-            "user_id": "2", 
-            "role": "lawyer",
-            "full_name": "Legal Practitioner"
-        }
-    }
-    
     user = demo_users.get(user_data.email)
-    if not user or not verify_password(user_data.password, user["password_hash"]):
+    hashed_password = user["password_hash"] if user else _DUMMY_HASH
+    # Password verification is CPU-bound; run it off the event loop
+    password_ok = await run_password_task(
+        verify_password, user_data.password, hashed_password
+    )
+    if not user or not password_ok:
         raise HTTPException(
             status_code=401,
             detail="Invalid email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # Create access token (default expiry)
     access_token = create_access_token(
-        data={
-            "sub": user["user_id"],
-            "email": user_data.email,
-            "role": user["role"],
-            "full_name": user["full_name"]
-        },
-        expires_delta=access_token_expires
+        sub=user["user_id"],
+        email=user_data.email,
+        role=user["role"],
+        full_name=user["full_name"]
     )
     
     return Token(
         access_token=access_token,
         token_type="bearer",
-        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        expires_in=_EXP_MIN * 60
     )
 
 
@@ -176,7 +209,7 @@ async def register(user_data: UserRegister) -> Dict[str, str]:
         Success message with user ID
     """
     # Demo registration logic - replace with actual user database creation
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await run_password_task(get_password_hash, user_data.password)
     
     # In production, save to database:
     # - Check if email already exists
@@ -191,7 +224,7 @@ async def register(user_data: UserRegister) -> Dict[str, str]:
     }
 
 
-@router.get("/me")
+@router.get("/me", response_model=UserInfo)
 async def get_current_user(token: str = Depends(security)) -> Dict[str, Any]:
     """
     Get current user information from token.
@@ -215,7 +248,7 @@ async def get_current_user(token: str = Depends(security)) -> Dict[str, Any]:
         else:
             token_str = str(token)
             
-        payload = jwt.decode(token_str, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_access_token(token_str)
         
         return {
             "user_id": payload.get("sub"),
@@ -231,7 +264,7 @@ async def get_current_user(token: str = Depends(security)) -> Dict[str, Any]:
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=401,
             detail="Could not validate credentials",
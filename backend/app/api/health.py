@@ -6,15 +6,39 @@ monitoring systems, and CI/CD pipelines.
 """
 
 from fastapi import APIRouter
-from datetime import datetime
+from pydantic import BaseModel
 from typing import Dict, Any
 import psutil
 import os
 
+from app.core import clock
+from app.core.config import PYTHON_VERSION
+
 router = APIRouter()
 
 
-@router.get("/")
+class HealthStatus(BaseModel):
+    """Basic health check response model."""
+    status: str
+    timestamp: str
+
+
+# CPU count, computed once at import
+_CPU_COUNT = psutil.cpu_count()
+
+
+def init_cpu_sampler() -> None:
+    """
+    Prime psutil's CPU usage sampler.
+    
+    The first non-blocking cpu_percent() call always returns 0.0, so
+    this is called once at startup to establish a baseline. Later calls
+    report usage since the previous call without blocking.
+    """
+    psutil.cpu_percent(interval=None)
+
+
+@router.get("/", response_model=HealthStatus)
 async def health_check() -> Dict[str, Any]:
     """
     Basic health check endpoint.
@@ -27,7 +51,7 @@ async def health_check() -> Dict[str, Any]:
     """
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": clock.now_iso()
     }
 
 
@@ -51,11 +75,11 @@ async def detailed_health_check() -> Dict[str, Any]:
         # Get system metrics
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = psutil.cpu_percent(interval=None)
         
         return {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": clock.now_iso(),
             "system": {
                 "memory": {
                     "total": memory.total,
@@ -71,17 +95,17 @@ async def detailed_health_check() -> Dict[str, Any]:
                 },
                 "cpu": {
                     "percent": cpu_percent,
-                    "count": psutil.cpu_count()
+                    "count": _CPU_COUNT
                 },
                 "process": {
                     "pid": os.getpid(),
-                    "python_version": f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}"
+                    "python_version": PYTHON_VERSION
                 }
             }
         }
     except Exception as e:
         return {
             "status": "degraded",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": clock.now_iso(),
             "error": f"Health check failed: {str(e)}"
         }
\ No newline at end of file
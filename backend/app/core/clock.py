@@ -0,0 +1,66 @@
+"""
+Coarse-grained clock for response timestamps.
+
+Keeps a cached ISO-8601 UTC timestamp that a background task refreshes
+periodically, so request handlers can read the current time without
+formatting a datetime on every request.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+# Refresh interval for the cached timestamp, in seconds
+REFRESH_INTERVAL = 0.1
+
+_now_iso: str = datetime.utcnow().isoformat()
+_refresh_task: Optional["asyncio.Task[None]"] = None
+
+
+def now_iso() -> str:
+    """
+    Get the cached current UTC time.
+
+    Accurate to within REFRESH_INTERVAL while the refresh task runs.
+    Falls back to formatting the current time directly when the task
+    has not been started (e.g. startup hooks were not run). Use
+    datetime.utcnow() directly where sub-second precision matters.
+
+    Returns:
+        ISO-8601 formatted UTC timestamp
+    """
+    if _refresh_task is None:
+        return datetime.utcnow().isoformat()
+    return _now_iso
+
+
+async def _refresh() -> None:
+    """Update the cached timestamp every REFRESH_INTERVAL seconds."""
+    global _now_iso
+    while True:
+        _now_iso = datetime.utcnow().isoformat()
+        await asyncio.sleep(REFRESH_INTERVAL)
+
+
+def start() -> None:
+    """
+    Start the background timestamp refresh task.
+
+    Must be called from within a running event loop, typically
+    from an application startup hook.
+    """
+    global _refresh_task
+    if _refresh_task is None:
+        _refresh_task = asyncio.create_task(_refresh())
+
+
+async def stop() -> None:
+    """Cancel the background timestamp refresh task."""
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
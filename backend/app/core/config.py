@@ -6,11 +6,28 @@ using Pydantic for validation and type safety.
 """
 
 from pydantic_settings import BaseSettings
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 import os
+import sys
 from pathlib import Path
 
 
+def _available_cpus() -> int:
+    """
+    Count the CPUs this process may run on.
+    
+    Respects CPU affinity (e.g. container cpusets) where the platform
+    supports it, falling back to the host CPU count.
+    
+    Returns:
+        Number of usable CPUs (at least 1)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 class Settings(BaseSettings):
     """
     Application settings class.
@@ -23,12 +40,20 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     ENVIRONMENT: str = "development"
+    WORKERS: int = 1
     
     # Security Configuration
     SECRET_KEY: str = "development-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Password Hashing (argon2id, OWASP defaults: m=46 MiB, t=1, p=1)
+    ARGON2_MEMORY_COST: int = 47104  # KiB
+    ARGON2_TIME_COST: int = 1
+    ARGON2_PARALLELISM: int = 1
+    # Hashing worker processes per server worker; 0 hashes in threads
+    PASSWORD_POOL_SIZE: int = _available_cpus()
+    
     # Database Configuration
     DATABASE_URL: str = "sqlite:///./legaltech.db"
     
@@ -56,13 +81,35 @@ class Settings(BaseSettings):
     
     class Config:
         """Pydantic configuration."""
-        env_file = ".env"
+        # Only read .env when present; containerized deployments pass
+        # configuration through environment variables directly
+        env_file: Optional[str] = ".env" if os.path.exists(".env") else None
+        env_file_encoding = "utf-8"
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get application settings.
+    
+    Settings are loaded and validated once, then cached so every
+    caller shares the same instance. They are treated as immutable
+    after startup, so modules may bind values they read on hot paths
+    to module globals at import.
+    
+    Returns:
+        Application settings instance
+    """
+    return Settings()
+
+
 # Create global settings instance
-settings = Settings()
+settings = get_settings()
 
 # Ensure upload directory exists
 upload_path = Path(settings.UPLOAD_DIR)
-upload_path.mkdir(exist_ok=True)
\ No newline at end of file
+upload_path.mkdir(exist_ok=True)
+
+# Interpreter version reported by health endpoints
+PYTHON_VERSION = "{}.{}.{}".format(*sys.version_info[:3])
@@ -0,0 +1,179 @@
+"""
+Password hashing utilities for the LegalTech MVP application.
+
+Provides the argon2id hashing context and a process pool for running
+hashes off the event loop. Kept separate from the API modules so pool
+workers only import what they need to hash passwords.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Password hashing context (argon2id, cost parameters from settings)
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__type="id",
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
+
+# Workers are started through a forkserver (or spawn where unavailable)
+# rather than forked from the multi-threaded server process
+_POOL_SIZE = settings.PASSWORD_POOL_SIZE
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _mp_context = multiprocessing.get_context("forkserver")
+    _mp_context.set_forkserver_preload([__name__])
+else:
+    _mp_context = multiprocessing.get_context("spawn")
+
+# Process pool for password hashing, created by the app startup hook
+_password_pool: Optional[ProcessPoolExecutor] = None
+_pool_starting = False
+_rebuild_task: Optional["asyncio.Task[None]"] = None
+
+T = TypeVar("T")
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify password against hash.
+
+    Uses argon2id to verify plain text password against stored hash.
+
+    Args:
+        plain_password: The plain text password
+        hashed_password: The stored password hash
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    """
+    Hash password using argon2id.
+
+    Creates secure password hash for storage.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Argon2id password hash
+    """
+    return pwd_context.hash(password)
+
+
+def _worker_pid() -> int:
+    """Return the worker's PID; used to start pool workers."""
+    return os.getpid()
+
+
+def _warm_pool(pool: ProcessPoolExecutor) -> None:
+    """Submit one task per worker so all workers start up front."""
+    futures = [pool.submit(_worker_pid) for _ in range(_POOL_SIZE)]
+    for future in futures:
+        future.result()
+
+
+async def init_password_pool() -> None:
+    """
+    Start the password hashing process pool.
+
+    Hashing is CPU-bound, so running it in worker processes lets
+    concurrent logins use all cores instead of contending for the GIL.
+    Workers are started in a background thread so the first login
+    does not pay for process startup on the event loop.
+
+    If PASSWORD_POOL_SIZE is 0 or the pool cannot be started, hashing
+    stays on the threadpool; start failures are logged rather than
+    stopping the application.
+    """
+    global _password_pool, _pool_starting
+    if _POOL_SIZE < 1 or _password_pool is not None or _pool_starting:
+        return
+
+    _pool_starting = True
+    pool: Optional[ProcessPoolExecutor] = None
+    try:
+        pool = ProcessPoolExecutor(max_workers=_POOL_SIZE, mp_context=_mp_context)
+        await run_in_threadpool(_warm_pool, pool)
+        _password_pool = pool
+    except Exception:
+        logger.exception("Failed to start password hashing pool; using threadpool")
+        if pool is not None:
+            pool.shutdown(wait=False)
+    finally:
+        _pool_starting = False
+
+
+async def shutdown_password_pool() -> None:
+    """
+    Shut down the password hashing process pool.
+
+    Waits for any in-progress pool restart first, so a pool it creates
+    is shut down here too rather than outliving the application.
+    """
+    global _password_pool, _rebuild_task
+    if _rebuild_task is not None:
+        await _rebuild_task
+        _rebuild_task = None
+
+    pool = _password_pool
+    _password_pool = None
+    if pool is not None:
+        await run_in_threadpool(pool.shutdown, True)
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool and schedule a replacement."""
+    global _password_pool, _rebuild_task
+    if _password_pool is not pool:
+        return
+
+    logger.warning("Password hashing pool is broken; restarting it")
+    _password_pool = None
+    pool.shutdown(wait=False)
+    _rebuild_task = asyncio.create_task(init_password_pool())
+
+
+async def run_password_task(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a password hashing function off the event loop.
+
+    Uses the process pool when it is running, falling back to the
+    threadpool otherwise (e.g. when startup hooks are not run, or
+    while a broken pool is being replaced).
+
+    Args:
+        func: Module-level (picklable) function to run
+        *args: Arguments passed to the function
+
+    Returns:
+        The function's return value
+    """
+    pool = _password_pool
+    if pool is None:
+        return await run_in_threadpool(func, *args)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        _discard_broken_pool(pool)
+        return await run_in_threadpool(func, *args)
@@ -7,22 +7,101 @@ and API routing for the legal technology platform.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+import orjson
 import uvicorn
-from datetime import datetime
-import os
-from typing import Dict, Any
+from typing import Dict, Any, Type
 
-from app.core.config import settings
+from app.core import clock, security
+from app.core.config import PYTHON_VERSION, settings
 from app.api import health, auth
 
+# Environment name as a module global for request handlers
+_ENVIRONMENT = settings.ENVIRONMENT
+
+# Static response bodies, pre-encoded at import; handlers only splice
+# in the timestamp per request
+_ROOT_INFO: Dict[str, Any] = {
+    "message": "LegalTech MVP API",
+    "version": "1.0.0",
+    "description": "A scalable Legal Technology platform",
+    "environment": _ENVIRONMENT,
+    "docs_url": "/docs"
+}
+
+_API_INFO: Dict[str, Any] = {
+    "message": "LegalTech MVP API",
+    "version": "1.0.0",
+    "endpoints": {
+        "health": "/health",
+        "docs": "/docs",
+        "redoc": "/redoc",
+        "auth": "/api/auth",
+    }
+}
+
+# Pre-encoded error response bodies. Request values are spliced in as
+# orjson-encoded JSON strings so they are always correctly escaped.
+_NOT_FOUND_TEMPLATE = (
+    b'{"error":"Route not found","path":%s,"method":%s,"timestamp":"%s"}'
+)
+_INTERNAL_ERROR_TEMPLATE = (
+    b'{"error":"Internal server error","detail":%s,"timestamp":"%s"}'
+)
+_INTERNAL_ERROR_DETAIL = orjson.dumps("Internal server error")
+
+
+class RootResponse(BaseModel):
+    """Root endpoint response model."""
+    message: str
+    version: str
+    description: str
+    environment: str
+    docs_url: str
+    timestamp: str
+
+
+class HealthResponse(BaseModel):
+    """Health check response model."""
+    status: str
+    timestamp: str
+    environment: str
+    python_version: str
+    api_version: str
+
+
+class ApiInfoResponse(BaseModel):
+    """API information response model."""
+    message: str
+    version: str
+    endpoints: Dict[str, str]
+    timestamp: str
+
+
+def _timestamped_template(model: Type[BaseModel], info: Dict[str, Any]) -> bytes:
+    """
+    Encode a static body as a template with a trailing timestamp slot.
+    
+    The body is validated against and dumped through its response model,
+    so the pre-encoded bytes always match the documented schema.
+    """
+    static = model(**info, timestamp="").model_dump(exclude={"timestamp"})
+    return orjson.dumps(static)[:-1].replace(b"%", b"%%") + b',"timestamp":"%s"}'
+
+
+_ROOT_TEMPLATE = _timestamped_template(RootResponse, _ROOT_INFO)
+_API_TEMPLATE = _timestamped_template(ApiInfoResponse, _API_INFO)
+
+
 # Create FastAPI application instance
 app = FastAPI(
     title="LegalTech MVP API",
     description="A scalable Legal Technology platform API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS middleware for frontend integration
@@ -35,8 +114,8 @@ app.add_middleware(
 )
 
 
-@app.get("/")
-async def root() -> Dict[str, Any]:
+@app.get("/", response_model=RootResponse)
+async def root() -> Response:
     """
     Root endpoint providing API information.
     
@@ -44,19 +123,13 @@ async def root() -> Dict[str, Any]:
     Useful for API discovery and health monitoring.
     
     Returns:
-        Dict containing API metadata, version, and timestamp
+        JSON response containing API metadata, version, and timestamp
     """
-    return {
-        "message": "LegalTech MVP API",
-        "version": "1.0.0",
-        "description": "A scalable Legal Technology platform",
-        "timestamp": datetime.utcnow().isoformat(),
-        "environment": settings.ENVIRONMENT,
-        "docs_url": "/docs"
-    }
+    body = _ROOT_TEMPLATE % clock.now_iso().encode()
+    return Response(content=body, media_type="application/json")
 
 
-@app.get("/health")
+@app.get("/health", response_model=HealthResponse)
 async def health_check() -> Dict[str, Any]:
     """
     Health check endpoint for monitoring and load balancers.
@@ -69,15 +142,15 @@ async def health_check() -> Dict[str, Any]:
     """
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "environment": settings.ENVIRONMENT,
-        "python_version": f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}",
+        "timestamp": clock.now_iso(),
+        "environment": _ENVIRONMENT,
+        "python_version": PYTHON_VERSION,
         "api_version": "1.0.0"
     }
 
 
-@app.get("/api")
-async def api_info() -> Dict[str, Any]:
+@app.get("/api", response_model=ApiInfoResponse)
+async def api_info() -> Response:
     """
     API information endpoint.
     
@@ -85,19 +158,10 @@ async def api_info() -> Dict[str, Any]:
     Used by frontend to verify backend connectivity and version.
     
     Returns:
-        Dict containing API details and available endpoints
+        JSON response containing API details and available endpoints
     """
-    return {
-        "message": "LegalTech MVP API",
-        "version": "1.0.0",
-        "timestamp": datetime.utcnow().isoformat(),
-        "endpoints": {
-            "health": "/health",
-            "docs": "/docs",
-            "redoc": "/redoc",
-            "auth": "/api/auth",
-        }
-    }
+    body = _API_TEMPLATE % clock.now_iso().encode()
+    return Response(content=body, media_type="application/json")
 
 
 # Include API routers
@@ -105,6 +169,33 @@ app.include_router(health.router, prefix="/api/health", tags=["health"])
 app.include_router(auth.router, prefix="/api/auth", tags=["authentication"])
 
 
+@app.on_event("startup")
+async def startup() -> None:
+    """
+    Application startup hook.
+    
+    Primes the CPU usage sampler so detailed health checks can
+    read CPU usage without blocking the event loop, starts the
+    cached response timestamp refresh, and starts the password
+    hashing process pool.
+    """
+    health.init_cpu_sampler()
+    clock.start()
+    await security.init_password_pool()
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """
+    Application shutdown hook.
+    
+    Stops the cached response timestamp refresh and the password
+    hashing process pool.
+    """
+    await clock.stop()
+    await security.shutdown_password_pool()
+
+
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     """
@@ -117,17 +208,15 @@ async def not_found_handler(request, exc):
         exc: The exception that was raised
         
     Returns:
-        JSONResponse with 404 status and error details
-    """
-    return JSONResponse(
-        status_code=404,
-        content={
-            "error": "Route not found",
-            "path": str(request.url.path),
-            "method": request.method,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        JSON response with 404 status and error details
+    """
+    body = _NOT_FOUND_TEMPLATE % (
+        orjson.dumps(request.url.path),
+        orjson.dumps(request.method),
+        clock.now_iso().encode()
     )
+    
+    return Response(content=body, status_code=404, media_type="application/json")
 
 
 @app.exception_handler(500)
@@ -143,26 +232,28 @@ async def internal_error_handler(request, exc):
         exc: The exception that was raised
         
     Returns:
-        JSONResponse with 500 status and error details
+        JSON response with 500 status and error details
     """
-    error_detail = str(exc) if settings.ENVIRONMENT == "development" else "Internal server error"
+    if _ENVIRONMENT == "development":
+        error_detail = orjson.dumps(str(exc))
+    else:
+        error_detail = _INTERNAL_ERROR_DETAIL
+    body = _INTERNAL_ERROR_TEMPLATE % (error_detail, clock.now_iso().encode())
     
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "Internal server error",
-            "detail": error_detail,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-    )
+    return Response(content=body, status_code=500, media_type="application/json")
 
 
 if __name__ == "__main__":
-    # Run the application with uvicorn
+    # Run the application with uvicorn. The default "auto" loop and http
+    # settings pick uvloop and httptools when uvicorn[standard] installs
+    # them, and fall back to asyncio and h11 where it does not.
+    is_development = settings.ENVIRONMENT == "development"
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.ENVIRONMENT == "development",
+        reload=is_development,
+        workers=None if is_development else settings.WORKERS,
+        access_log=is_development,
         log_level=settings.LOG_LEVEL.lower()
-    )
\ No newline at end of file
+    )
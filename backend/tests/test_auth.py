@@ -0,0 +1,117 @@
+"""
+Tests for JWT access token handling.
+
+Covers the validated-payload cache in decode_access_token and the
+/api/auth/me endpoint built on it.
+"""
+
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import auth
+from app.main import app
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start and end every test with an empty token cache."""
+    auth._token_cache.clear()
+    yield
+    auth._token_cache.clear()
+
+
+def test_valid_token_is_cached():
+    token = auth.create_access_token(sub="1", email="admin@legaltech.com")
+
+    payload = auth.decode_access_token(token)
+
+    assert payload["sub"] == "1"
+    assert len(auth._token_cache) == 1
+
+
+def test_cached_token_is_served_without_decoding(monkeypatch):
+    token = auth.create_access_token(sub="1")
+    auth.decode_access_token(token)
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("cached token was decoded again")
+
+    monkeypatch.setattr(jwt, "decode", fail_decode)
+
+    assert auth.decode_access_token(token)["sub"] == "1"
+
+
+def test_cached_token_past_expiry_raises_and_is_evicted(monkeypatch):
+    token = auth.create_access_token(sub="1", expires_delta=timedelta(seconds=60))
+    auth.decode_access_token(token)
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("expired token should be rejected from cache")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    monkeypatch.setattr(jwt, "decode", fail_decode)
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        auth.decode_access_token(token)
+    assert len(auth._token_cache) == 0
+
+
+def test_token_with_wrong_signature_is_not_cached():
+    token = jwt.encode(
+        {"sub": "1", "exp": int(time.time()) + 60},
+        "some-other-key",
+        algorithm=auth._ALGORITHM,
+    )
+
+    with pytest.raises(jwt.InvalidTokenError):
+        auth.decode_access_token(token)
+    assert len(auth._token_cache) == 0
+
+
+def test_malformed_token_is_not_cached():
+    with pytest.raises(jwt.InvalidTokenError):
+        auth.decode_access_token("not-a-jwt")
+    assert len(auth._token_cache) == 0
+
+
+def test_expired_token_is_not_cached():
+    token = auth.create_access_token(sub="1", expires_delta=timedelta(seconds=-1))
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        auth.decode_access_token(token)
+    assert len(auth._token_cache) == 0
+
+
+def test_me_returns_user_from_token():
+    client = TestClient(app)
+    token = auth.create_access_token(
+        sub="2",
+        email="lawyer@legaltech.com",
+        role="lawyer",
+        full_name="Legal Practitioner",
+    )
+
+    response = client.get(
+        "/api/auth/me", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["user_id"] == "2"
+    assert body["role"] == "lawyer"
+
+
+def test_me_rejects_invalid_token():
+    client = TestClient(app)
+
+    response = client.get(
+        "/api/auth/me", headers={"Authorization": "Bearer not-a-jwt"}
+    )
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Could not validate credentials"
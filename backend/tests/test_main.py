@@ -0,0 +1,51 @@
+"""
+Tests for the application-level endpoints and error handlers.
+
+Covers the pre-encoded response bodies served by /, /api and the
+custom 404 handler.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.main import ApiInfoResponse, RootResponse, app
+
+client = TestClient(app)
+
+
+def test_root_matches_response_model():
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = RootResponse(**response.json())
+    assert body.message == "LegalTech MVP API"
+    assert body.timestamp
+
+
+def test_api_info_matches_response_model():
+    response = client.get("/api")
+
+    assert response.status_code == 200
+    body = ApiInfoResponse(**response.json())
+    assert body.endpoints["auth"] == "/api/auth"
+
+
+def test_not_found_body():
+    response = client.get("/no-such-route")
+
+    assert response.status_code == 404
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["error"] == "Route not found"
+    assert body["path"] == "/no-such-route"
+    assert body["method"] == "GET"
+    assert body["timestamp"]
+
+
+def test_not_found_escapes_path():
+    # Starlette decodes the path, so these reach the handler as raw
+    # quote and backslash characters
+    response = client.get("/a%22b%5Cc")
+
+    assert response.status_code == 404
+    assert response.json()["path"] == '/a"b\\c'
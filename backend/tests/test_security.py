@@ -0,0 +1,118 @@
+"""
+Tests for the password hashing process pool.
+
+Covers start-up failure handling, the threadpool fallback when a
+worker dies, and replacement of a broken pool.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from app.core import security
+
+
+async def _break_pool(pool):
+    """Kill one worker and wait until the pool notices."""
+    worker = next(iter(pool._processes.values()))
+    worker.kill()
+    worker.join()
+    for _ in range(500):
+        if pool._broken:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("pool was not marked broken")
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_password_pool(monkeypatch):
+    """Run each test with a small pool and shut it down afterwards."""
+    monkeypatch.setattr(security, "_POOL_SIZE", 2)
+    yield
+    await security.shutdown_password_pool()
+
+
+@pytest.fixture(scope="module")
+def password_hash():
+    """Argon2 hash of a known password."""
+    return security.get_password_hash("secret")
+
+
+@pytest.mark.asyncio
+async def test_pool_starts_all_workers():
+    await security.init_password_pool()
+
+    assert security._password_pool is not None
+    assert len(security._password_pool._processes) == 2
+
+
+@pytest.mark.asyncio
+async def test_runs_in_pool(password_hash):
+    await security.init_password_pool()
+
+    assert await security.run_password_task(
+        security.verify_password, "secret", password_hash
+    )
+    assert not await security.run_password_task(
+        security.verify_password, "wrong", password_hash
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_disabled_by_zero_size(monkeypatch, password_hash):
+    monkeypatch.setattr(security, "_POOL_SIZE", 0)
+
+    await security.init_password_pool()
+
+    assert security._password_pool is None
+    assert await security.run_password_task(
+        security.verify_password, "secret", password_hash
+    )
+
+
+@pytest.mark.asyncio
+async def test_start_failure_falls_back_to_threadpool(monkeypatch, password_hash):
+    def fail_warm(pool):
+        raise OSError("process pool unavailable")
+
+    monkeypatch.setattr(security, "_warm_pool", fail_warm)
+
+    await security.init_password_pool()
+
+    assert security._password_pool is None
+    assert await security.run_password_task(
+        security.verify_password, "secret", password_hash
+    )
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_falls_back_and_is_replaced(password_hash):
+    await security.init_password_pool()
+    broken_pool = security._password_pool
+    await _break_pool(broken_pool)
+
+    assert await security.run_password_task(
+        security.verify_password, "secret", password_hash
+    )
+
+    assert security._rebuild_task is not None
+    await security._rebuild_task
+    assert security._password_pool is not None
+    assert security._password_pool is not broken_pool
+    assert await security.run_password_task(
+        security.verify_password, "secret", password_hash
+    )
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_pool_restart():
+    await security.init_password_pool()
+    broken_pool = security._password_pool
+    await _break_pool(broken_pool)
+
+    security._discard_broken_pool(broken_pool)
+    await security.shutdown_password_pool()
+
+    assert security._rebuild_task is None
+    assert security._password_pool is None